@@ -1,28 +1,55 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, WebSocket
+from typing import List
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, WebSocket
+from fastapi.responses import StreamingResponse
 
 from app.models.domain import ProjectResult, ProjectStatus
 from app.models.schemas import GenerateRequest, GenerateResponse, ProjectResultResponse, WorkflowEventResponse
-from app.services.stores import data_store
+from app.services.export import compute_export_etag, etag_matches, iter_project_zip
+from app.services.stores import DataStore, get_data_store
 from app.services.workflow import run_workflow, stream_workflow
 
 router = APIRouter(tags=["generate"])
 
+MAX_EXPORT_PROJECTS = 20
+
 
 @router.post("/generate", response_model=GenerateResponse)
-async def generate_content(payload: GenerateRequest) -> GenerateResponse:
-    project = data_store.create_project(theme=payload.theme)
-    identity_chunks = data_store.list_identity_contents()
+async def generate_content(payload: GenerateRequest, store: DataStore = Depends(get_data_store)) -> GenerateResponse:
+    project = store.create_project(theme=payload.theme)
+    identity_chunks = store.list_identity_contents()
     result = run_workflow(theme=payload.theme, identity_chunks=identity_chunks)
     result.id = project.id
-    data_store.update_project(project_id=project.id, result=result)
+    store.update_project(project_id=project.id, result=result)
     return GenerateResponse(project_id=project.id, status=result.status, preview=result.outputs)
 
 
+# Export routes are plain `def` so uncached Supabase lookups run in the threadpool, not on the event loop.
+@router.get("/generate/export.zip")
+def export_projects_zip(
+    project_ids: List[str] = Query(..., max_length=MAX_EXPORT_PROJECTS),
+    if_none_match: str | None = Header(default=None),
+    store: DataStore = Depends(get_data_store),
+) -> Response:
+    projects = [_get_exportable_project(store, project_id) for project_id in dict.fromkeys(project_ids)]
+    return _zip_response(projects, filename="quadvoice-export.zip", nested=True, if_none_match=if_none_match)
+
+
+@router.get("/generate/{project_id}/export.zip")
+def export_project_zip(
+    project_id: str,
+    if_none_match: str | None = Header(default=None),
+    store: DataStore = Depends(get_data_store),
+) -> Response:
+    project = _get_exportable_project(store, project_id)
+    return _zip_response([project], filename=f"quadvoice-{project.id}.zip", nested=False, if_none_match=if_none_match)
+
+
 @router.get("/generate/{project_id}", response_model=ProjectResultResponse)
-async def get_generation_result(project_id: str) -> ProjectResultResponse:
-    project = data_store.get_project(project_id)
+async def get_generation_result(project_id: str, store: DataStore = Depends(get_data_store)) -> ProjectResultResponse:
+    project = store.get_project(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="project not found")
     return ProjectResultResponse(
@@ -34,20 +61,38 @@ async def get_generation_result(project_id: str) -> ProjectResultResponse:
     )
 
 
+def _get_exportable_project(store: DataStore, project_id: str) -> ProjectResult:
+    project = store.get_project(project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail=f"project not found: {project_id}")
+    if project.status != ProjectStatus.completed:
+        raise HTTPException(status_code=409, detail=f"project not completed: {project_id}")
+    return project
+
+
+def _zip_response(projects: List[ProjectResult], filename: str, nested: bool, if_none_match: str | None) -> Response:
+    etag = compute_export_etag(projects)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(iter_project_zip(projects, nested=nested), media_type="application/zip", headers=headers)
+
+
 @router.websocket("/ws/generate/{project_id}")
-async def stream_workflow_route(websocket: WebSocket, project_id: str) -> None:
+async def stream_workflow_route(websocket: WebSocket, project_id: str, store: DataStore = Depends(get_data_store)) -> None:
     await websocket.accept()
-    project = data_store.get_project(project_id)
+    project = store.get_project(project_id)
     if not project:
         await websocket.send_json({"error": "project not found"})
         await websocket.close(code=1008)
         return
 
-    identity_chunks = data_store.list_identity_contents()
+    identity_chunks = store.list_identity_contents()
 
     try:
         async def run_and_stream() -> None:
-            async for item in _async_stream(identity_chunks, project.theme, project.id):
+            async for item in _async_stream(store, identity_chunks, project.theme, project.id):
                 if isinstance(item, WorkflowEventResponse):
                     await websocket.send_json(item.dict())
                 elif isinstance(item, ProjectResult):
@@ -60,11 +105,11 @@ async def stream_workflow_route(websocket: WebSocket, project_id: str) -> None:
         await websocket.close(code=1011)
 
 
-async def _async_stream(identity_chunks: list[str], theme: str, project_id: str):
+async def _async_stream(store: DataStore, identity_chunks: list[str], theme: str, project_id: str):
     for item in stream_workflow(theme=theme, identity_chunks=identity_chunks):
         if isinstance(item, ProjectResult):
             item.id = project_id
-            data_store.update_project(project_id=project_id, result=item)
+            store.update_project(project_id=project_id, result=item)
             yield item
         else:
             yield WorkflowEventResponse.from_domain(item)
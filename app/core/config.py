@@ -15,6 +15,7 @@ class Settings(BaseSettings):
     anthropic_model: str = "claude-3-5-sonnet-20241022"
     embedding_dimensions: int = 1536
     allowed_origins: str | List[str] = Field(default="*")
+    prewarm_services: bool = True
 
     @field_validator("allowed_origins", mode="before")
     @classmethod
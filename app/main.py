@@ -1,13 +1,50 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import generate, ingest
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+def prewarm_services() -> None:
+    """Build the store, LLM client and compiled graph so the first request does not pay for SDK imports."""
+    from app.services.llm import get_anthropic_client
+    from app.services.stores import get_data_store
+    from app.services.workflow import get_compiled_graph
+
+    get_data_store()
+    get_anthropic_client()
+    get_compiled_graph()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Prewarm in the background so uvicorn binds the port (and /health answers) immediately.
+    task: asyncio.Task | None = None
+    if settings.prewarm_services:
+        task = asyncio.create_task(asyncio.to_thread(prewarm_services))
+        task.add_done_callback(_log_prewarm_failure)
+    yield
+    if task is not None and not task.done():
+        task.cancel()
+
+
+def _log_prewarm_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Service prewarm failed; falling back to lazy init", exc_info=task.exception())
+
+
 app = FastAPI(
     title="QuadVoice API",
     description="Adaptive content generation platform",
     version=settings.app_version,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
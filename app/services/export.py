@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import hashlib
+import zipfile
+from typing import Iterable, Iterator, List
+
+from app.models.domain import ProjectResult
+
+# Fixed entry timestamp keeps archives byte-identical for unchanged outputs, so the ETag stays valid.
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_WRITE_CHUNK_SIZE = 64 * 1024
+
+
+class _ChunkSink:
+    """Write-only, non-seekable sink; zipfile falls back to data descriptors and we drain bytes as they arrive."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        yield from chunks
+
+
+def compute_export_etag(projects: Iterable[ProjectResult]) -> str:
+    digest = hashlib.sha256()
+    for project in projects:
+        digest.update(project.id.encode("utf-8"))
+        digest.update(b"\0")
+        for platform, content in sorted(project.outputs.items()):
+            digest.update(platform.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(content.encode("utf-8"))
+            digest.update(b"\0")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def iter_project_zip(projects: List[ProjectResult], nested: bool = False) -> Iterator[bytes]:
+    """Yield a deflated ZIP with one markdown file per platform without holding the archive in memory."""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:  # type: ignore[arg-type]
+        for project in projects:
+            prefix = f"{project.id}/" if nested else ""
+            for platform, content in sorted(project.outputs.items()):
+                info = zipfile.ZipInfo(f"{prefix}{platform}.md", date_time=_ZIP_DATE_TIME)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                payload = content.encode("utf-8")
+                with archive.open(info, mode="w") as entry:
+                    for start in range(0, len(payload), _WRITE_CHUNK_SIZE):
+                        entry.write(payload[start : start + _WRITE_CHUNK_SIZE])
+                        yield from sink.drain()
+                yield from sink.drain()
+    yield from sink.drain()
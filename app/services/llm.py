@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from typing import Dict, List, Optional
-
-from anthropic import Anthropic
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from app.core.config import settings
 from app.models.domain import PlatformName
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+
 logger = logging.getLogger(__name__)
 
+_anthropic_client: Optional[Anthropic] = None
+_anthropic_client_lock = threading.Lock()
+
 
 def embed_text(text: str, dimensions: int) -> List[float]:
     # Simple deterministic hash-based embedding for local dev; replace with real embedding model in production.
@@ -21,18 +26,26 @@ def embed_text(text: str, dimensions: int) -> List[float]:
     return result
 
 
-def _get_anthropic_client() -> Optional[Anthropic]:
+def get_anthropic_client() -> Optional[Anthropic]:
+    """Return the shared client; only a successful init is cached so transient failures are retried."""
+    global _anthropic_client
     if not settings.anthropic_api_key:
         return None
-    try:
-        return Anthropic(api_key=settings.anthropic_api_key)
-    except Exception as exc:  # pragma: no cover - external init
-        logger.warning("Failed to init Anthropic client: %s", exc)
-        return None
+    if _anthropic_client is None:
+        with _anthropic_client_lock:
+            if _anthropic_client is None:
+                try:
+                    from anthropic import Anthropic
+
+                    _anthropic_client = Anthropic(api_key=settings.anthropic_api_key)
+                except Exception as exc:  # pragma: no cover - external init
+                    logger.warning("Failed to init Anthropic client: %s", exc)
+                    return None
+    return _anthropic_client
 
 
 def generate_article(theme: str, platform: PlatformName, angle: str, identity_summary: str, style_rules: Dict[str, str]) -> str:
-    client = _get_anthropic_client()
+    client = get_anthropic_client()
     prompt = (
         f"You are drafting an article for {platform.value}.\n"
         f"Theme: {theme}\n"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Dict, List, Optional
 
 from app.models.domain import IdentityDoc, IdentityDocType, PlatformName, PlatformStyle, ProjectResult, ProjectStatus, WorkflowEvent, new_id
@@ -130,4 +131,20 @@ class DataStore:
             logger.warning("Supabase hydrate style failed: %s", exc)
 
 
-data_store = DataStore()
+_data_store: DataStore | None = None
+_data_store_lock = threading.Lock()
+
+
+def get_data_store() -> DataStore:
+    """Return the process-wide store, creating (and hydrating) it on first use.
+
+    Routes inject it with `Depends(get_data_store)`; as a sync dependency it runs in the
+    threadpool, so waiting on the lock during prewarm never blocks the event loop.
+    """
+    global _data_store
+    if _data_store is None:
+        # Lock so a prewarm thread and a first request never build two stores with split in-memory state.
+        with _data_store_lock:
+            if _data_store is None:
+                _data_store = DataStore()
+    return _data_store
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
-
-from supabase import Client, create_client
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,8 @@ def get_supabase_client() -> Optional[Client]:
         logger.warning("Supabase credentials missing; falling back to in-memory store")
         return None
     try:
+        from supabase import create_client
+
         return create_client(settings.supabase_url, settings.supabase_service_key)
     except Exception as exc:  # pragma: no cover - external client init
         logger.warning("Failed to initialize Supabase client: %s", exc)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, TypedDict
-
-from langgraph.graph import END, StateGraph
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, TypedDict
 
 from app.models.domain import PlatformName, ProjectResult, ProjectStatus, WorkflowEvent
 from app.services.llm import generate_article
 
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+
+_compiled_graph: Any = None
+_compiled_graph_lock = threading.Lock()
+
 
 class WorkflowState(TypedDict):
     theme: str
@@ -69,6 +74,8 @@ def _refine_node(state: WorkflowState) -> WorkflowState:
 
 
 def build_graph() -> StateGraph:
+    from langgraph.graph import END, StateGraph
+
     graph = StateGraph(WorkflowState)
     graph.add_node("intent", _intent_node)
     graph.add_node("angle", _angle_node)
@@ -83,8 +90,18 @@ def build_graph() -> StateGraph:
     return graph
 
 
+def get_compiled_graph() -> Any:
+    """Return the shared compiled graph, building it once even if prewarm and a request race."""
+    global _compiled_graph
+    if _compiled_graph is None:
+        with _compiled_graph_lock:
+            if _compiled_graph is None:
+                _compiled_graph = build_graph().compile()
+    return _compiled_graph
+
+
 def run_workflow(theme: str, identity_chunks: List[str]) -> ProjectResult:
-    graph = build_graph().compile()
+    graph = get_compiled_graph()
     initial_state: WorkflowState = {
         "theme": theme,
         "identity_chunks": identity_chunks,
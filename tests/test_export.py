@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import io
+import random
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes.generate import MAX_EXPORT_PROJECTS
+from app.main import app
+from app.models.domain import ProjectResult, ProjectStatus
+from app.services.export import iter_project_zip
+from app.services.stores import get_data_store
+
+OUTPUTS = {"qiita": "# qiita\n", "zenn": "# zenn\n", "note": "# note\n", "owned": "# owned\n"}
+
+
+@pytest.fixture
+def client() -> TestClient:
+    # No lifespan: the in-memory store is built on first use and no prewarm thread starts.
+    return TestClient(app)
+
+
+def _completed_project(outputs: dict[str, str] | None = None) -> ProjectResult:
+    project = get_data_store().create_project(theme="export")
+    project.status = ProjectStatus.completed
+    project.outputs = dict(outputs or OUTPUTS)
+    return project
+
+
+def _names(content: bytes) -> list[str]:
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert archive.testzip() is None
+        return sorted(archive.namelist())
+
+
+def test_single_export_returns_zip_with_etag(client: TestClient) -> None:
+    project = _completed_project()
+    response = client.get(f"/api/v1/generate/{project.id}/export.zip")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    assert response.headers["etag"].startswith('"')
+    assert project.id in response.headers["content-disposition"]
+    assert _names(response.content) == ["note.md", "owned.md", "qiita.md", "zenn.md"]
+
+
+def test_repeat_downloads_are_identical(client: TestClient) -> None:
+    project = _completed_project()
+    first = client.get(f"/api/v1/generate/{project.id}/export.zip")
+    second = client.get(f"/api/v1/generate/{project.id}/export.zip")
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+
+
+@pytest.mark.parametrize("header", ["{etag}", "W/{etag}", '"other", {etag}', "*"])
+def test_matching_if_none_match_returns_304(client: TestClient, header: str) -> None:
+    project = _completed_project()
+    etag = client.get(f"/api/v1/generate/{project.id}/export.zip").headers["etag"]
+    response = client.get(f"/api/v1/generate/{project.id}/export.zip", headers={"If-None-Match": header.format(etag=etag)})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_changed_outputs_change_etag(client: TestClient) -> None:
+    project = _completed_project()
+    etag = client.get(f"/api/v1/generate/{project.id}/export.zip").headers["etag"]
+    project.outputs["zenn"] = "# zenn v2\n"
+    response = client.get(f"/api/v1/generate/{project.id}/export.zip", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_unknown_project_returns_404(client: TestClient) -> None:
+    assert client.get("/api/v1/generate/missing/export.zip").status_code == 404
+
+
+def test_unfinished_project_returns_409(client: TestClient) -> None:
+    project = get_data_store().create_project(theme="pending")
+    assert client.get(f"/api/v1/generate/{project.id}/export.zip").status_code == 409
+
+
+def test_bulk_export_nests_by_project_and_drops_duplicates(client: TestClient) -> None:
+    first, second = _completed_project(), _completed_project({"zenn": "# z\n"})
+    response = client.get("/api/v1/generate/export.zip", params={"project_ids": [first.id, second.id, first.id]})
+    assert response.status_code == 200
+    expected = sorted([f"{first.id}/{platform}.md" for platform in OUTPUTS] + [f"{second.id}/zenn.md"])
+    assert _names(response.content) == expected
+
+
+def test_bulk_export_without_ids_returns_422(client: TestClient) -> None:
+    assert client.get("/api/v1/generate/export.zip").status_code == 422
+
+
+def test_bulk_export_over_limit_returns_422(client: TestClient) -> None:
+    project = _completed_project()
+    assert client.get("/api/v1/generate/export.zip", params={"project_ids": [project.id] * MAX_EXPORT_PROJECTS}).status_code == 200
+    ids = [f"id-{index}" for index in range(MAX_EXPORT_PROJECTS + 1)]
+    assert client.get("/api/v1/generate/export.zip", params={"project_ids": ids}).status_code == 422
+
+
+def test_bulk_export_with_unfinished_project_returns_409(client: TestClient) -> None:
+    done = _completed_project()
+    pending = get_data_store().create_project(theme="pending")
+    assert client.get("/api/v1/generate/export.zip", params={"project_ids": [done.id, pending.id]}).status_code == 409
+
+
+def test_large_entry_is_streamed_in_chunks() -> None:
+    # Random hex barely compresses, so the deflated entry stays in the megabytes.
+    content = random.Random(0).randbytes(3 * 1024 * 1024).hex()
+    project = ProjectResult(id="big", theme="big", status=ProjectStatus.completed, outputs={"zenn": content})
+    chunks = list(iter_project_zip([project]))
+    assert len(chunks) > 10
+    assert max(len(chunk) for chunk in chunks) < len(content) // 10
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.read("zenn.md").decode("utf-8") == content
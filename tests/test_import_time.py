@@ -0,0 +1,73 @@
+"""Import-time budget for `app.main`; heavy SDKs must stay lazy so cold starts bind the port quickly."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# Budget for what app.main adds on top of `fastapi`, measured in the same trace so machine speed cancels out.
+# The app's own modules (settings, schemas, routes) cost ~130ms here; a single eager SDK import
+# (anthropic, supabase or langgraph) adds several hundred more, so 300ms leaves headroom without masking one.
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", "300"))
+HEAVY_MODULES = ("langgraph", "anthropic", "supabase")
+
+_PROBE = (
+    "import sys, app.main; "
+    f"print(','.join(sorted(m for m in sys.modules if m.split('.')[0] in {HEAVY_MODULES!r})))"
+)
+
+
+@dataclass
+class ImportTrace:
+    cumulative_us: dict[str, int]
+    loaded_heavy: list[str]
+
+
+def _parse_importtime(trace: str) -> dict[str, int]:
+    """Map module name to cumulative microseconds from `-X importtime` stderr."""
+    cumulative: dict[str, int] = {}
+    for line in trace.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        cumulative[parts[2].strip()] = int(parts[1].strip())
+    return cumulative
+
+
+@pytest.fixture(scope="module")
+def import_trace() -> ImportTrace:
+    env = {**os.environ, "PREWARM_SERVICES": "false"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = [name for name in completed.stdout.strip().split(",") if name]
+    return ImportTrace(cumulative_us=_parse_importtime(completed.stderr), loaded_heavy=loaded)
+
+
+def test_app_main_import_within_budget(import_trace: ImportTrace) -> None:
+    cumulative = import_trace.cumulative_us
+    assert "app.main" in cumulative, "app.main missing from -X importtime trace"
+    assert "fastapi" in cumulative, "fastapi missing from -X importtime trace"
+    overhead_ms = (cumulative["app.main"] - cumulative["fastapi"]) / 1000
+    assert overhead_ms <= IMPORT_BUDGET_MS, (
+        f"import app.main took {overhead_ms:.0f}ms beyond fastapi (budget {IMPORT_BUDGET_MS:.0f}ms)"
+    )
+
+
+def test_app_main_does_not_import_heavy_sdks(import_trace: ImportTrace) -> None:
+    traced = sorted(name for name in import_trace.cumulative_us if name.split(".")[0] in HEAVY_MODULES)
+    assert traced == [], f"heavy SDKs in import trace: {traced}"
+    assert import_trace.loaded_heavy == [], f"heavy SDKs in sys.modules: {import_trace.loaded_heavy}"